@@ -1,7 +1,14 @@
 """gngram-counter: Google Ngram frequency counter."""
 
 from gngram_counter.data import get_data_dir, get_hash_file, is_data_installed
-from gngram_counter.lookup import FrequencyData, batch_frequency, exists, frequency
+from gngram_counter.lookup import (
+    FrequencyData,
+    batch_frequency,
+    exists,
+    frequency,
+    preload_all_buckets,
+    set_bucket_cache_size,
+)
 
 __all__ = [
     "get_data_dir",
@@ -11,4 +18,6 @@ __all__ = [
     "frequency",
     "batch_frequency",
     "FrequencyData",
+    "set_bucket_cache_size",
+    "preload_all_buckets",
 ]
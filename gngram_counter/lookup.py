@@ -12,8 +12,10 @@ possessives, and hyphenated compounds are absent. Fallback strategies:
 from __future__ import annotations
 
 import hashlib
-from functools import lru_cache
-from typing import TypedDict
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import NamedTuple
 
 import polars as pl
 
@@ -21,50 +23,216 @@ from gngram_counter.data import get_hash_file, is_data_installed
 from gngram_counter.normalize import normalize
 
 
-class FrequencyData(TypedDict):
-    """Frequency data for a word."""
+class FrequencyData(NamedTuple):
+    """Frequency data for a word.
+
+    Fields read as attributes (freq.peak_tf) or, as with the earlier dict
+    form, by key (freq["peak_tf"]).
+    """
 
     peak_tf: int  # Decade with highest term frequency
     peak_df: int  # Decade with highest document frequency
     sum_tf: int  # Total term frequency across all decades
     sum_df: int  # Total document frequency across all decades
 
+    def __getitem__(self, key: str | int | slice) -> int | tuple[int, ...]:
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
 
 # Contraction suffixes stored as separate tokens in the ngram corpus
-# Order matters: longer suffixes must be checked before shorter ones
 CONTRACTION_SUFFIXES = ("n't", "'ll", "'re", "'ve", "'m", "'d")
 
+# Matches a non-empty stem followed by one contraction suffix or 's
+# (contractions like "it's" and possessives like "ship's"). fullmatch anchors
+# the suffix to the end of the word and the lazy stem takes the shortest
+# prefix that leaves a whole suffix, so the order of alternatives is irrelevant
+_CONTRACTION_RE = re.compile(
+    r"(.+?)(" + "|".join(re.escape(s) for s in CONTRACTION_SUFFIXES + ("'s",)) + r")",
+    re.DOTALL,
+)
+
+# Columns read from each bucket; anything else in the file is never loaded
+BUCKET_COLUMNS = ["hash", "peak_tf", "peak_df", "sum_tf", "sum_df"]
+
+# Bucket filename prefix for each possible first MD5 byte
+_PREFIXES = tuple(f"{i:02x}" for i in range(256))
+
+
+def _read_bucket(prefix: str) -> dict[int, FrequencyData]:
+    """Read a parquet bucket file into a ready-made lookup dict.
+
+    Keys are the 64-bit digest keys produced by _hash_normalized; values are
+    prebuilt (immutable) FrequencyData shared by every lookup, so a hit is a
+    single dict probe. Only BUCKET_COLUMNS are read, and every row is
+    decoded once while the dict is built.
+
+    The prebuilt values trade memory for speed: a bucket holds a key int, a
+    4-tuple and its ints per row, over three times the size of the same
+    bucket as a Polars DataFrame. The peak columns are decades, so each
+    distinct decade is shared as one int object rather than one per row.
+    """
+    cols = pl.read_parquet(get_hash_file(prefix), columns=BUCKET_COLUMNS).to_dict(as_series=False)
+    decades = {d: d for d in {*cols["peak_tf"], *cols["peak_df"]}}
+    return {
+        int(h[:16], 16): FrequencyData(decades[peak_tf], decades[peak_df], sum_tf, sum_df)
+        for h, peak_tf, peak_df, sum_tf, sum_df in zip(
+            cols["hash"], cols["peak_tf"], cols["peak_df"], cols["sum_tf"], cols["sum_df"]
+        )
+    }
+
+
+# There are exactly 256 buckets, so an unbounded cache holds at most all of
+# them: about 4.1 MB of Python objects per bucket, ~1.05 GB in total, by
+# tracemalloc while building a bucket (the parquet files are ~110 MB). Use
+# set_bucket_cache_size() to cap it.
+_load_bucket = lru_cache(maxsize=None)(_read_bucket)
+
+
+def set_bucket_cache_size(n: int | None) -> None:
+    """Set how many buckets are kept in memory.
+
+    Buckets are cached without a limit by default. Each loaded bucket takes
+    about 4.1 MB in memory, so all 256 come to ~1.05 GB. A smaller n evicts
+    least recently used buckets; None restores the unbounded default. Any
+    cached buckets are dropped.
+
+    Args:
+        n: Maximum number of cached buckets, or None for no limit
+    """
+    global _load_bucket
+    _load_bucket = lru_cache(maxsize=n)(_read_bucket)
+
+
+def preload_all_buckets(max_workers: int = 8) -> None:
+    """Load all 256 buckets into the cache in parallel.
+
+    Parquet decoding releases the GIL, so a thread pool hides most of the
+    cold-start cost of a large, diverse batch_frequency call. The same cache
+    serves exists(), frequency() and batch_frequency(). If the cache has been
+    capped with set_bucket_cache_size(n), only the last n buckets loaded stay
+    resident.
+
+    Args:
+        max_workers: Number of loader threads
+
+    Raises:
+        FileNotFoundError: If data files are not installed
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(_load_bucket, _PREFIXES))
 
-@lru_cache(maxsize=256)
-def _load_bucket(prefix: str) -> pl.DataFrame:
-    """Load and cache a parquet bucket file."""
-    return pl.read_parquet(get_hash_file(prefix))
 
+@lru_cache(maxsize=8192)
+def _hash_normalized(word: str) -> tuple[str, int]:
+    """Hash an already-normalized word and return (prefix, suffix).
 
-def _hash_word(word: str) -> tuple[str, str]:
-    """Hash a word and return (prefix, suffix)."""
-    h = hashlib.md5(normalize(word).encode("utf-8")).hexdigest()
-    return h[:2], h[2:]
+    The prefix is the two-hex-char bucket name; the suffix is the next 8
+    bytes of the MD5 digest as a 64-bit integer, which is what bucket indexes
+    are keyed by. With ~20k words per bucket the chance of two sharing a key
+    is around 1e-11.
+    """
+    d = hashlib.md5(word.encode("utf-8")).digest()
+    return _PREFIXES[d[0]], int.from_bytes(d[1:9], "big")
+
+
+def _hash_words_bulk(normalized_words: list[str]) -> list[tuple[str, int]]:
+    """Hash many already-normalized words and return (prefix, suffix) pairs.
+
+    Like _hash_normalized, no normalization is applied; callers pass the
+    output of normalize().
+    """
+    md5 = hashlib.md5
+    digests = [md5(w.encode("utf-8")).digest() for w in normalized_words]
+    from_bytes = int.from_bytes
+    return [(_PREFIXES[d[0]], from_bytes(d[1:9], "big")) for d in digests]
+
+
+@cache
+def _ensure_installed() -> None:
+    """Raise FileNotFoundError unless data files are installed.
+
+    Only a successful check is cached (exceptions are not), so the data
+    directory is scanned once per process. Call _ensure_installed.cache_clear()
+    if the data is removed mid-process.
+    """
+    if not is_data_installed():
+        raise FileNotFoundError(
+            "Data files not installed. Run: python -m gngram_counter.download_data"
+        )
 
 
 def _lookup_frequency(word: str) -> FrequencyData | None:
-    """Look up frequency data for a single word form (no fallbacks)."""
-    if not word:
+    """Look up frequency data for a single normalized word form (no fallbacks)."""
+    # The corpus holds only alphabetic words; anything else is a known miss
+    # and needs no hashing or bucket load
+    if not word.isalpha():
         return None
-    prefix, suffix = _hash_word(word)
+    prefix, suffix = _hash_normalized(word)
     try:
-        df = _load_bucket(prefix)
+        return _load_bucket(prefix).get(suffix)
     except FileNotFoundError:
         return None
-    row = df.filter(pl.col("hash") == suffix)
-    if len(row) == 0:
+
+
+def _lookup_exists(word: str) -> bool:
+    """Check whether a single normalized word form is present (no fallbacks)."""
+    if not word.isalpha():
+        return False
+    prefix, suffix = _hash_normalized(word)
+    try:
+        return suffix in _load_bucket(prefix)
+    except FileNotFoundError:
+        return False
+
+
+def _batch_lookup(
+    normalized_words: list[str], missing_ok: bool = False
+) -> dict[str, FrequencyData | None]:
+    """Look up many distinct normalized word forms (no fallbacks).
+
+    Non-alphabetic forms can never match and are resolved without hashing.
+    Buckets are probed on the calling thread; a warm probe is a dict lookup,
+    so threads would only add overhead. Call preload_all_buckets() first to
+    load cold buckets in parallel.
+
+    Args:
+        normalized_words: Distinct normalized word forms
+        missing_ok: Treat a missing bucket file as a miss instead of raising,
+            as _lookup_frequency does
+
+    Returns:
+        Dict mapping each normalized word to its FrequencyData or None.
+    """
+    results: dict[str, FrequencyData | None] = {w: None for w in normalized_words if not w.isalpha()}
+    alpha_words = [w for w in normalized_words if w.isalpha()]
+    for normalized, (prefix, suffix) in zip(alpha_words, _hash_words_bulk(alpha_words)):
+        try:
+            bucket = _load_bucket(prefix)
+        except FileNotFoundError:
+            if not missing_ok:
+                raise
+            bucket = {}
+        results[normalized] = bucket.get(suffix)
+    return results
+
+
+def _lookup_hyphenated(parts: list[str]) -> FrequencyData | None:
+    """Return the first part's frequency if every part is found, else None.
+
+    The first part's result is kept from the existence check rather than
+    looked up again.
+    """
+    first_freq = _lookup_frequency(parts[0])
+    if first_freq is None:
         return None
-    return FrequencyData(
-        peak_tf=row["peak_tf"][0],
-        peak_df=row["peak_df"][0],
-        sum_tf=row["sum_tf"][0],
-        sum_df=row["sum_df"][0],
-    )
+    for p in parts[1:]:
+        if _lookup_frequency(p) is None:
+            return None
+    return first_freq
 
 
 def _split_contraction(word: str) -> tuple[str, str] | None:
@@ -72,36 +240,29 @@ def _split_contraction(word: str) -> tuple[str, str] | None:
 
     Handles standard contractions (n't, 'll, etc.) and possessives ('s).
     The ngram corpus only has pure alpha words, so both contractions and
-    possessives need stem-based fallback.
+    possessives need stem-based fallback. The stem is stripped, so spaced
+    forms such as "dog 's" fall back to "dog".
 
     Returns:
         Tuple of (stem, suffix) or None if no pattern matches.
     """
-    for suffix in CONTRACTION_SUFFIXES:
-        if word.endswith(suffix):
-            stem = word[:-len(suffix)]
-            if stem:
-                return (stem, suffix)
-
-    # Any 's — covers both contractions ("it's") and possessives ("ship's")
-    if word.endswith("'s"):
-        stem = word[:-2]
-        if stem:
-            return (stem, "'s")
-
-    return None
+    m = _CONTRACTION_RE.fullmatch(word)
+    return (m.group(1).strip(), m.group(2)) if m else None
 
 
 def _split_hyphenated(word: str) -> list[str] | None:
     """Split a hyphenated word into its component parts.
 
+    Parts are stripped, so spaced forms such as "quarter - deck" split into
+    ["quarter", "deck"].
+
     Returns:
         List of parts if the word contains hyphens and has at least 2
         non-empty parts, or None otherwise.
     """
     if "-" not in word:
         return None
-    parts = [p for p in word.split("-") if p]
+    parts = [p.strip() for p in word.split("-") if p]
     if len(parts) < 2:
         return None
     return parts
@@ -124,27 +285,31 @@ def exists(word: str) -> bool:
     Raises:
         FileNotFoundError: If data files are not installed
     """
-    if not is_data_installed():
-        raise FileNotFoundError(
-            "Data files not installed. Run: python -m gngram_counter.download_data"
-        )
+    _ensure_installed()
 
     word = normalize(word)
 
-    if _lookup_frequency(word) is not None:
-        return True
+    # Hot path, inlined from _lookup_exists. Alphabetic words cannot take
+    # either fallback, and nothing else can match directly (the corpus is
+    # purely alphabetic), so only they need the direct probe
+    if word.isalpha():
+        prefix, suffix = _hash_normalized(word)
+        try:
+            return suffix in _load_bucket(prefix)
+        except FileNotFoundError:
+            return False
 
     # Contraction/possessive fallback
     parts = _split_contraction(word)
     if parts:
         stem, _ = parts
-        if _lookup_frequency(stem) is not None:
+        if _lookup_exists(stem):
             return True
 
     # Hyphenated fallback: all parts must exist
     hyp_parts = _split_hyphenated(word)
     if hyp_parts:
-        if all(_lookup_frequency(p) is not None for p in hyp_parts):
+        if all(_lookup_exists(p) for p in hyp_parts):
             return True
 
     return False
@@ -162,21 +327,24 @@ def frequency(word: str) -> FrequencyData | None:
         word: The word to look up (case-insensitive)
 
     Returns:
-        FrequencyData dict with peak_tf, peak_df, sum_tf, sum_df, or None if not found
+        FrequencyData with peak_tf, peak_df, sum_tf, sum_df, or None if not found
 
     Raises:
         FileNotFoundError: If data files are not installed
     """
-    if not is_data_installed():
-        raise FileNotFoundError(
-            "Data files not installed. Run: python -m gngram_counter.download_data"
-        )
+    _ensure_installed()
 
     word = normalize(word)
 
-    result = _lookup_frequency(word)
-    if result is not None:
-        return result
+    # Hot path, inlined from _lookup_frequency. Alphabetic words cannot take
+    # either fallback, and nothing else can match directly (the corpus is
+    # purely alphabetic), so only they need the direct probe
+    if word.isalpha():
+        prefix, suffix = _hash_normalized(word)
+        try:
+            return _load_bucket(prefix).get(suffix)
+        except FileNotFoundError:
+            return None
 
     # Contraction/possessive fallback: return the stem's frequency
     parts = _split_contraction(word)
@@ -189,8 +357,7 @@ def frequency(word: str) -> FrequencyData | None:
     # Hyphenated fallback: return first component's frequency
     hyp_parts = _split_hyphenated(word)
     if hyp_parts:
-        if all(_lookup_frequency(p) is not None for p in hyp_parts):
-            return _lookup_frequency(hyp_parts[0])
+        return _lookup_hyphenated(hyp_parts)
 
     return None
 
@@ -207,62 +374,52 @@ def batch_frequency(words: list[str]) -> dict[str, FrequencyData | None]:
     Raises:
         FileNotFoundError: If data files are not installed
     """
-    if not is_data_installed():
-        raise FileNotFoundError(
-            "Data files not installed. Run: python -m gngram_counter.download_data"
-        )
+    _ensure_installed()
 
-    # Group words by bucket prefix for efficient batch lookups
-    by_prefix: dict[str, list[tuple[str, str, str]]] = {}
-    fallback_words: list[str] = []
-
-    for word in words:
-        normalized = normalize(word)
-        prefix, suffix = _hash_word(normalized)
-        if prefix not in by_prefix:
-            by_prefix[prefix] = []
-        by_prefix[prefix].append((word, normalized, suffix))
+    # Duplicate inputs (common with Zipfian token streams) are looked up once
+    unique_words = list(dict.fromkeys(words))
+    normalized_words = [normalize(word) for word in unique_words]
+    direct = _batch_lookup(list(dict.fromkeys(normalized_words)))
 
     results: dict[str, FrequencyData | None] = {}
-
-    for prefix, entries in by_prefix.items():
-        df = _load_bucket(prefix)
-        suffixes = [s for _, _, s in entries]
-
-        # Filter to all matching suffixes at once
-        matches = df.filter(pl.col("hash").is_in(suffixes))
-        match_dict = {row["hash"]: row for row in matches.iter_rows(named=True)}
-
-        for word, normalized, suffix in entries:
-            if suffix in match_dict:
-                row = match_dict[suffix]
-                results[word] = FrequencyData(
-                    peak_tf=row["peak_tf"],
-                    peak_df=row["peak_df"],
-                    sum_tf=row["sum_tf"],
-                    sum_df=row["sum_df"],
-                )
-            else:
-                results[word] = None
-                fallback_words.append(word)
-
-    # Fallback for words not found directly
-    for word in fallback_words:
-        normalized = normalize(word)
-
-        # Contraction/possessive fallback
+    fallback_words: list[tuple[str, str]] = []
+
+    for word, normalized in zip(unique_words, normalized_words):
+        freq = direct[normalized]
+        results[word] = freq
+        if freq is None:
+            fallback_words.append((word, normalized))
+
+    if not fallback_words:
+        return results
+
+    # Fallback for words not found directly: collect every candidate stem and
+    # hyphenated part, then look them all up in one batched pass. Like
+    # _lookup_frequency, a missing bucket is a miss here rather than an error
+    plans: list[tuple[str, str | None, list[str] | None]] = []
+    candidates: dict[str, None] = {}
+    for word, normalized in fallback_words:
         parts = _split_contraction(normalized)
-        if parts:
-            stem, _ = parts
-            stem_freq = _lookup_frequency(stem)
-            if stem_freq is not None:
-                results[word] = stem_freq
-                continue
-
-        # Hyphenated fallback
+        stem = parts[0] if parts else None
         hyp_parts = _split_hyphenated(normalized)
-        if hyp_parts:
-            if all(_lookup_frequency(p) is not None for p in hyp_parts):
-                results[word] = _lookup_frequency(hyp_parts[0])
+        if stem is None and hyp_parts is None:
+            continue
+        plans.append((word, stem, hyp_parts))
+        if stem is not None:
+            candidates[stem] = None
+        if hyp_parts is not None:
+            candidates.update(dict.fromkeys(hyp_parts))
+
+    found = _batch_lookup(list(candidates), missing_ok=True)
+
+    for word, stem, hyp_parts in plans:
+        # Contraction/possessive fallback: the stem's frequency
+        if stem is not None and found[stem] is not None:
+            results[word] = found[stem]
+            continue
+
+        # Hyphenated fallback: the first part's frequency, if all parts exist
+        if hyp_parts is not None and all(found[p] is not None for p in hyp_parts):
+            results[word] = found[hyp_parts[0]]
 
     return results
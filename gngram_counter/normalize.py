@@ -57,6 +57,10 @@ def normalize(text: str) -> str:
 
     Applies: apostrophe normalization, accent stripping, lowercase, strip whitespace.
     """
+    if text.isascii():
+        # Fast path: accent stripping is a no-op on ASCII, and the grave
+        # accent is the only ASCII apostrophe variant
+        return text.replace("`", "'").lower().strip()
     text = normalize_apostrophes(text)
     text = strip_accents(text)
     return text.lower().strip()
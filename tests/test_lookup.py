@@ -7,14 +7,25 @@ Tests cover:
 - Edge cases (empty strings, special chars, unicode)
 """
 
+import hashlib
+
+import pytest
+
 from gngram_counter import (
+    FrequencyData,
     batch_frequency,
     exists,
     frequency,
     is_data_installed,
+    lookup,
+    preload_all_buckets,
+    set_bucket_cache_size,
 )
 from gngram_counter.lookup import (
-    _hash_word,
+    _hash_normalized,
+    _hash_words_bulk,
+    _lookup_exists,
+    _lookup_frequency,
     _split_contraction,
     _split_hyphenated,
 )
@@ -32,42 +43,79 @@ class TestDataInstallation:
         )
 
 
+def hash_word(word):
+    """Normalize and hash a word the way the lookup functions do."""
+    return _hash_normalized(normalize(word))
+
+
 class TestHashWord:
-    """Tests for the internal _hash_word function."""
+    """Tests for hashing normalized words with _hash_normalized."""
 
     def test_hash_word_returns_tuple(self):
-        prefix, suffix = _hash_word("test")
+        prefix, suffix = hash_word("test")
         assert isinstance(prefix, str)
-        assert isinstance(suffix, str)
+        assert isinstance(suffix, int)
 
     def test_hash_word_prefix_length(self):
-        prefix, suffix = _hash_word("example")
+        prefix, suffix = hash_word("example")
         assert len(prefix) == 2
 
-    def test_hash_word_suffix_length(self):
-        prefix, suffix = _hash_word("example")
-        assert len(suffix) == 30
+    def test_hash_word_suffix_fits_64_bits(self):
+        prefix, suffix = hash_word("example")
+        assert 0 <= suffix < 2**64
+
+    def test_hash_word_matches_md5_hex(self):
+        """Prefix and suffix should correspond to the on-disk MD5 hex layout."""
+        h = hashlib.md5(b"computer").hexdigest()
+        assert hash_word("computer") == (h[:2], int(h[2:18], 16))
 
     def test_hash_word_lowercase(self):
         """Hash should be case-insensitive."""
-        assert _hash_word("TEST") == _hash_word("test")
-        assert _hash_word("TeSt") == _hash_word("test")
+        assert hash_word("TEST") == hash_word("test")
+        assert hash_word("TeSt") == hash_word("test")
 
     def test_hash_word_consistent(self):
         """Same word should always produce same hash."""
-        assert _hash_word("hello") == _hash_word("hello")
+        assert hash_word("hello") == hash_word("hello")
 
     def test_hash_word_different_words(self):
         """Different words should produce different hashes."""
-        assert _hash_word("hello") != _hash_word("world")
+        assert hash_word("hello") != hash_word("world")
 
     def test_hash_word_curly_apostrophe_normalizes(self):
         """Curly apostrophe should hash identically to ASCII apostrophe."""
-        assert _hash_word("don't") == _hash_word("don\u2019t")
+        assert hash_word("don't") == hash_word("don\u2019t")
 
     def test_hash_word_whitespace_stripped(self):
         """Leading/trailing whitespace should be stripped before hashing."""
-        assert _hash_word("  hello  ") == _hash_word("hello")
+        assert hash_word("  hello  ") == hash_word("hello")
+
+    def test_hash_word_is_cached(self):
+        """Repeat hashes of the same word should be served from the cache."""
+        hash_word("cachedword")
+        hits = _hash_normalized.cache_info().hits
+        hash_word("CachedWord")
+        assert _hash_normalized.cache_info().hits == hits + 1
+
+    def test_hash_normalized_does_not_normalize(self):
+        assert _hash_normalized("DON'T") != hash_word("DON'T")
+        assert _hash_normalized("don't") == hash_word("DON\u2019T")
+
+
+class TestHashWordsBulk:
+    """Tests for the internal _hash_words_bulk function."""
+
+    def test_hash_words_bulk_matches_hash_normalized(self):
+        words = ["the", "hello", "don't", "quarter-deck"]
+        assert _hash_words_bulk(words) == [_hash_normalized(w) for w in words]
+
+    def test_hash_words_bulk_preserves_order_and_duplicates(self):
+        result = _hash_words_bulk(["a", "b", "a"])
+        assert len(result) == 3
+        assert result[0] == result[2]
+
+    def test_hash_words_bulk_empty(self):
+        assert _hash_words_bulk([]) == []
 
 
 class TestExists:
@@ -109,18 +157,31 @@ class TestExists:
 class TestFrequency:
     """Tests for the frequency() function."""
 
-    def test_frequency_common_word_returns_dict(self):
+    def test_frequency_common_word_returns_frequency_data(self):
         result = frequency("the")
         assert result is not None
-        assert isinstance(result, dict)
+        assert isinstance(result, FrequencyData)
+
+    def test_frequency_key_access_matches_attributes(self):
+        result = frequency("the")
+        assert result is not None
+        assert result["peak_tf"] == result.peak_tf
+        assert result["sum_df"] == result.sum_df
+        assert result[0] == result.peak_tf
+
+    def test_frequency_unknown_key_raises(self):
+        result = frequency("the")
+        assert result is not None
+        with pytest.raises(KeyError):
+            result["count"]
 
     def test_frequency_has_required_keys(self):
         result = frequency("the")
         assert result is not None
-        assert "peak_tf" in result
-        assert "peak_df" in result
-        assert "sum_tf" in result
-        assert "sum_df" in result
+        assert "peak_tf" in result._fields
+        assert "peak_df" in result._fields
+        assert "sum_tf" in result._fields
+        assert "sum_df" in result._fields
 
     def test_frequency_values_are_integers(self):
         result = frequency("the")
@@ -207,6 +268,12 @@ class TestBatchFrequency:
         # Should handle duplicates (last wins or deduped)
         assert "the" in result
 
+    def test_batch_frequency_duplicates_match_single(self):
+        result = batch_frequency(["the", "xyznotaword", "the", "xyznotaword"])
+        assert len(result) == 2
+        assert result["the"] == frequency("the")
+        assert result["xyznotaword"] is None
+
     def test_batch_frequency_case_preserved_in_keys(self):
         result = batch_frequency(["THE", "And", "hello"])
         # Keys should match input case
@@ -225,10 +292,10 @@ class TestBatchFrequency:
         result = batch_frequency(["the"])
         data = result["the"]
         assert data is not None
-        assert "peak_tf" in data
-        assert "peak_df" in data
-        assert "sum_tf" in data
-        assert "sum_df" in data
+        assert "peak_tf" in data._fields
+        assert "peak_df" in data._fields
+        assert "sum_tf" in data._fields
+        assert "sum_df" in data._fields
 
 
 class TestEdgeCases:
@@ -299,6 +366,73 @@ class TestCaching:
         assert exists("the") is True
 
 
+class TestBucketCache:
+    """Tests for set_bucket_cache_size()."""
+
+    def teardown_method(self):
+        set_bucket_cache_size(None)
+
+    def test_default_cache_is_unbounded(self):
+        assert lookup._load_bucket.cache_info().maxsize is None
+
+    def test_set_bucket_cache_size_limits_cache(self):
+        set_bucket_cache_size(2)
+        assert lookup._load_bucket.cache_info().maxsize == 2
+
+    def test_set_bucket_cache_size_evicts(self):
+        set_bucket_cache_size(1)
+        frequency("the")
+        frequency("computer")
+        assert lookup._load_bucket.cache_info().currsize == 1
+
+    def test_lookups_after_resize(self):
+        expected = frequency("the")
+        set_bucket_cache_size(1)
+        assert frequency("the") == expected
+        assert exists("the") is True
+
+    def test_preload_all_buckets(self):
+        preload_all_buckets(max_workers=4)
+        assert lookup._load_bucket.cache_info().currsize == 256
+        assert frequency("the") is not None
+
+    def test_preload_serves_exists_from_cache(self):
+        preload_all_buckets(max_workers=4)
+        misses = lookup._load_bucket.cache_info().misses
+        assert exists("the") is True
+        assert exists("xyznotarealword") is False
+        assert lookup._load_bucket.cache_info().misses == misses
+
+    def test_bucket_shares_decade_ints(self):
+        bucket = lookup._read_bucket(_hash_normalized("the")[0])
+        decades = {}
+        for freq in bucket.values():
+            assert decades.setdefault(freq.peak_tf, freq.peak_tf) is freq.peak_tf
+            assert decades.setdefault(freq.peak_df, freq.peak_df) is freq.peak_df
+
+
+class TestLookupExists:
+    """Tests for the internal _lookup_exists function."""
+
+    def test_lookup_exists_common_word(self):
+        assert _lookup_exists("the") is True
+
+    def test_lookup_exists_missing_word(self):
+        assert _lookup_exists("xyznotarealword123") is False
+
+    def test_lookup_exists_empty(self):
+        assert _lookup_exists("") is False
+
+    def test_lookup_non_alphabetic_is_miss(self):
+        for word in ("12345", "don't", "quarter-deck", "test123", "a b"):
+            assert _lookup_exists(word) is False
+            assert _lookup_frequency(word) is None
+
+    def test_lookup_exists_agrees_with_lookup_frequency(self):
+        for word in ("the", "computer", "xyznotaword", "don't"):
+            assert _lookup_exists(word) == (_lookup_frequency(word) is not None)
+
+
 class TestNormalize:
     """Tests for text normalization."""
 
@@ -314,6 +448,11 @@ class TestNormalize:
     def test_normalize_grave_accent(self):
         assert normalize("don\u0060t") == "don't"
 
+    def test_normalize_ascii_fast_path_matches_full_pipeline(self):
+        for text in ("  DON`T ", "Hello", "quarter-deck", "it's", ""):
+            expected = strip_accents(normalize_apostrophes(text)).lower().strip()
+            assert normalize(text) == expected
+
     def test_normalize_acute_accent(self):
         assert normalize("don\u00B4t") == "don't"
 
@@ -457,6 +596,10 @@ class TestSplitContraction:
         assert _split_contraction("they'll") == ("they", "'ll")
         assert _split_contraction("she'll") == ("she", "'ll")
 
+    def test_split_strips_stem(self):
+        assert _split_contraction("dog 's") == ("dog", "'s")
+        assert _split_contraction("do n't") == ("do", "n't")
+
 
 class TestContractionFallback:
     """Tests for contraction fallback in exists() and frequency()."""
@@ -562,10 +705,10 @@ class TestContractionFallback:
     def test_frequency_contraction_has_valid_structure(self):
         result = frequency("don't")
         assert result is not None
-        assert "peak_tf" in result
-        assert "peak_df" in result
-        assert "sum_tf" in result
-        assert "sum_df" in result
+        assert "peak_tf" in result._fields
+        assert "peak_df" in result._fields
+        assert "sum_tf" in result._fields
+        assert "sum_df" in result._fields
         assert isinstance(result["peak_tf"], int)
         assert isinstance(result["sum_tf"], int)
 
@@ -666,6 +809,9 @@ class TestSplitHyphenated:
         # "foo--bar" should still produce ["foo", "bar"]
         assert _split_hyphenated("foo--bar") == ["foo", "bar"]
 
+    def test_split_strips_parts(self):
+        assert _split_hyphenated("quarter - deck") == ["quarter", "deck"]
+
 
 class TestPossessiveFallback:
     """Tests for possessive fallback in exists() and frequency()."""
@@ -762,3 +908,45 @@ class TestHyphenatedFallback:
                 assert f is not None, f"exists=True but frequency=None for {word!r}"
             else:
                 assert f is None, f"exists=False but frequency!=None for {word!r}"
+
+    def test_spaced_forms_match_unspaced(self):
+        # Whitespace around the split point is stripped before lookup
+        for spaced, plain in (
+            ("quarter - deck", "quarter-deck"),
+            ("dog 's", "dog's"),
+            ("do n't", "don't"),
+        ):
+            assert exists(spaced) is True, f"{spaced!r} should exist"
+            assert frequency(spaced) == frequency(plain)
+            assert batch_frequency([spaced])[spaced] == frequency(plain)
+
+
+class TestBatchFallbackParity:
+    """batch_frequency() must agree with frequency() on fallback inputs."""
+
+    FALLBACK_WORDS = [
+        "don't", "DON'T", "do n't", "don\u2019t", "ship's", "dog 's",
+        "quarter-deck", "Quarter-Deck", "quarter - deck", "man-of-war",
+        "quarter-xyznotaword", "xyznotaword's", "a--b", "-foo", "n't",
+    ]
+
+    def test_batch_matches_single(self):
+        batch_result = batch_frequency(self.FALLBACK_WORDS)
+        for word in self.FALLBACK_WORDS:
+            assert batch_result[word] == frequency(word), (
+                f"batch != individual for {word!r}"
+            )
+
+    def test_missing_bucket_in_fallback_is_miss(self, monkeypatch):
+        # A missing bucket file for a fallback part is a miss, as in frequency()
+        missing = _hash_normalized("deck")[0]
+        load_bucket = lookup._load_bucket
+
+        def fake_load_bucket(prefix):
+            if prefix == missing:
+                raise FileNotFoundError(prefix)
+            return load_bucket(prefix)
+
+        monkeypatch.setattr(lookup, "_load_bucket", fake_load_bucket)
+        assert frequency("quarter-deck") is None
+        assert batch_frequency(["quarter-deck"]) == {"quarter-deck": None}